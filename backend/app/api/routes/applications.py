@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, selectinload
 from typing import List, Optional
 from uuid import uuid4
 from datetime import datetime
@@ -44,10 +44,10 @@ def deduplicate_checklist_items(categories):
 def get_applications(db: Session = Depends(get_db), current_user: User = Depends(get_any_authenticated_user)):
     print("Getting all applications with nested relationships loaded")
     
-    # Use explicit joins to load all nested relationships for all applications
+    # Load all nested relationships for all applications with one SELECT per level
     applications = db.query(Application).options(
-        joinedload(Application.application_categories).joinedload(Category.checklist_items),
-        joinedload(Application.platform_categories).joinedload(Category.checklist_items)
+        selectinload(Application.application_categories).selectinload(Category.checklist_items),
+        selectinload(Application.platform_categories).selectinload(Category.checklist_items)
     ).all()
     
     # Deduplicate checklist items for each application
@@ -120,10 +120,11 @@ def get_application(
 ):
     print(f"Getting application with ID: {application_id}")
     
-    # Use a more complex query with explicit joins to load all the nested relationships
+    # Load all the nested relationships with one SELECT per level instead of a
+    # joined row per checklist item
     application = db.query(Application).options(
-        joinedload(Application.application_categories).joinedload(Category.checklist_items),
-        joinedload(Application.platform_categories).joinedload(Category.checklist_items)
+        selectinload(Application.application_categories).selectinload(Category.checklist_items),
+        selectinload(Application.platform_categories).selectinload(Category.checklist_items)
     ).filter(Application.id == application_id).first()
     
     if application is None:
@@ -412,8 +413,8 @@ def create_application(
     
     # Load the application with all the relationships to ensure they're available for serialization
     application = db.query(Application).options(
-        joinedload(Application.application_categories).joinedload(Category.checklist_items),
-        joinedload(Application.platform_categories).joinedload(Category.checklist_items)
+        selectinload(Application.application_categories).selectinload(Category.checklist_items),
+        selectinload(Application.platform_categories).selectinload(Category.checklist_items)
     ).filter(Application.id == db_application.id).first()
     
     # Convert SQLAlchemy model to dictionary before returning
@@ -495,8 +496,8 @@ def update_application(
     
     # Load the updated application with all relationships
     updated_app = db.query(Application).options(
-        joinedload(Application.application_categories).joinedload(Category.checklist_items),
-        joinedload(Application.platform_categories).joinedload(Category.checklist_items)
+        selectinload(Application.application_categories).selectinload(Category.checklist_items),
+        selectinload(Application.platform_categories).selectinload(Category.checklist_items)
     ).filter(Application.id == application_id).first()
     
     # Convert SQLAlchemy model to dictionary before returning
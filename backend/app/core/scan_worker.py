@@ -0,0 +1,14 @@
+"""
+State of the regex scan pool worker processes.
+
+Kept out of workflow_service so the pool initializer runs in a new worker
+before workflow_service is imported there.
+"""
+
+IS_SCAN_WORKER = False
+
+
+def init_scan_worker() -> None:
+    """Mark the current process as a regex scan pool worker."""
+    global IS_SCAN_WORKER
+    IS_SCAN_WORKER = True
@@ -2,6 +2,8 @@
 import os
 import logging
 import json
+import threading
+import time
 from datetime import datetime
 import requests
 
@@ -25,6 +27,60 @@ logger.addHandler(file_handler)
 # Simple cache configuration
 cache_file = "llm_cache.json"
 
+# Rate limit configuration (requests per minute / tokens per minute)
+LLM_RPM_LIMIT = int(os.getenv("LLM_RPM_LIMIT", "60"))
+LLM_TPM_LIMIT = int(os.getenv("LLM_TPM_LIMIT", "150000"))
+# Tokens reserved for the completion when estimating the cost of a call
+LLM_COMPLETION_TOKENS = int(os.getenv("LLM_COMPLETION_TOKENS", "4000"))
+
+
+class TokenBucket:
+    """
+    Token bucket pacing LLM calls below the provider's RPM/TPM limits.
+
+    Both buckets refill continuously; acquire() blocks until one request slot
+    and the requested number of tokens are available. A limit of 0 or less
+    disables its bucket. Calls are made from worker threads, so waiting is
+    done on a threading.Condition.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last_refill = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60.0)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60.0)
+
+    def acquire(self, tokens: int):
+        if self.rpm <= 0 and self.tpm <= 0:
+            return
+        # Disabled buckets don't take anything, and a single call larger than
+        # the whole bucket would never be admitted
+        requests = 1 if self.rpm > 0 else 0
+        tokens = min(tokens, self.tpm) if self.tpm > 0 else 0
+        with self._cond:
+            while True:
+                self._refill()
+                if self._requests >= requests and self._tokens >= tokens:
+                    self._requests -= requests
+                    self._tokens -= tokens
+                    return
+                # Sleep just long enough for the scarcer bucket to refill
+                wait_requests = (requests - self._requests) * 60.0 / self.rpm if requests else 0
+                wait_tokens = (tokens - self._tokens) * 60.0 / self.tpm if tokens else 0
+                self._cond.wait(timeout=max(wait_requests, wait_tokens, 0.01))
+
+
+rate_limiter = TokenBucket(LLM_RPM_LIMIT, LLM_TPM_LIMIT)
+
 
 # # By default, we Google Gemini 2.5 pro, as it shows great performance for code understanding
 # def call_llm(prompt: str, use_cache: bool = True) -> str:
@@ -129,6 +185,8 @@ def call_llm(prompt, use_cache: bool = True):
         prompt = first_part + "\n\n[...content truncated due to length...]\n\n" + last_part
     
     client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY", "your-api-key"), base_url=os.environ.get("OPENAI_URL", "http://localhost:1234/v1"))
+    # Pace calls below the rate limits instead of bursting into 429 retries
+    rate_limiter.acquire(estimate_tokens(prompt) + LLM_COMPLETION_TOKENS)
     r = client.chat.completions.create(
         model="o1",
         messages=[{"role": "user", "content": prompt}],
@@ -1,18 +1,23 @@
 """
 This module contains structured validation prompts for different checklist categories.
 Each prompt is designed to validate compliance with specific requirements.
+
+Prompts are string.Template objects using $name placeholders, so the JSON
+output examples can be written without brace escaping.
 """
 
+from string import Template
+
 # Generic validation prompt template
-GENERIC_VALIDATION_PROMPT = """
+GENERIC_VALIDATION_PROMPT = Template("""
 You are a specialized validator for cloud application compliance requirements.
 
 CONTEXT:
-- Checklist Item: {description}
-- Current Status: {status}
-- Application Description: {app_description}
-- Evidence Context: {evidence_context}
-- Repository: {repository_url} (Commit: {commit_id})
+- Checklist Item: $description
+- Current Status: $status
+- Application Description: $app_description
+- Evidence Context: $evidence_context
+- Repository: $repository_url (Commit: $commit_id)
 
 INSTRUCTIONS:
 Evaluate if the provided evidence demonstrates compliance with the checklist requirement.
@@ -20,7 +25,7 @@ Analyze the given code snippets, documentation, or context thoroughly.
 Base your evaluation only on the information provided.
 
 CODE SNIPPETS TO ANALYZE:
-{code_snippets}
+$code_snippets
 
 VALIDATION TASKS:
 1. Determine whether the application complies with the checklist requirement
@@ -29,34 +34,34 @@ VALIDATION TASKS:
 4. Provide actionable recommendations for improvement
 
 REQUIRED OUTPUT FORMAT (JSON):
-{{
+{
   "is_compliant": boolean,
   "confidence": "high|medium|low",
   "summary": "Brief assessment summary, 1-2 sentences",
   "detailed_analysis": "Detailed explanation of your findings",
   "findings": [
-    {{
+    {
       "description": "Description of finding",
       "severity": "info|warning|error|critical",
       "code_location": "file:line (if applicable)",
       "recommendation": "Specific recommendation to address this finding"
-    }}
+    }
   ],
   "evidence": "Specific, concrete evidence from the provided context that supports your determination"
-}}
-"""
+}
+""")
 
 # Security validation prompts
 SECURITY_VALIDATION_PROMPTS = {
-    "authentication": """
+    "authentication": Template("""
 You are a specialized validator for application authentication requirements.
 
 CONTEXT:
-- Checklist Item: {description}
-- Current Status: {status}
-- Application Description: {app_description}
-- Evidence Context: {evidence_context}
-- Repository: {repository_url} (Commit: {commit_id})
+- Checklist Item: $description
+- Current Status: $status
+- Application Description: $app_description
+- Evidence Context: $evidence_context
+- Repository: $repository_url (Commit: $commit_id)
 
 SPECIFIC INSTRUCTIONS:
 Evaluate the authentication mechanisms implemented in the code. Look specifically for:
@@ -67,7 +72,7 @@ Evaluate the authentication mechanisms implemented in the code. Look specificall
 5. Multi-factor authentication if required
 
 CODE SNIPPETS TO ANALYZE:
-{code_snippets}
+$code_snippets
 
 VALIDATION TASKS:
 1. Determine whether the application implements secure authentication mechanisms
@@ -76,32 +81,32 @@ VALIDATION TASKS:
 4. Provide actionable recommendations for improvement
 
 REQUIRED OUTPUT FORMAT (JSON):
-{{
+{
   "is_compliant": boolean,
   "confidence": "high|medium|low",
   "summary": "Brief assessment summary, 1-2 sentences",
   "detailed_analysis": "Detailed explanation of your findings",
   "findings": [
-    {{
+    {
       "description": "Description of finding",
       "severity": "info|warning|error|critical",
       "code_location": "file:line (if applicable)",
       "recommendation": "Specific recommendation to address this finding"
-    }}
+    }
   ],
   "evidence": "Specific code examples or documentation that supports your determination"
-}}
-""",
+}
+"""),
 
-    "authorization": """
+    "authorization": Template("""
 You are a specialized validator for application authorization requirements.
 
 CONTEXT:
-- Checklist Item: {description}
-- Current Status: {status}
-- Application Description: {app_description}
-- Evidence Context: {evidence_context}
-- Repository: {repository_url} (Commit: {commit_id})
+- Checklist Item: $description
+- Current Status: $status
+- Application Description: $app_description
+- Evidence Context: $evidence_context
+- Repository: $repository_url (Commit: $commit_id)
 
 SPECIFIC INSTRUCTIONS:
 Evaluate the authorization mechanisms implemented in the code. Look specifically for:
@@ -112,7 +117,7 @@ Evaluate the authorization mechanisms implemented in the code. Look specifically
 5. Authorization bypass vulnerabilities
 
 CODE SNIPPETS TO ANALYZE:
-{code_snippets}
+$code_snippets
 
 VALIDATION TASKS:
 1. Determine whether the application implements secure authorization controls
@@ -121,32 +126,32 @@ VALIDATION TASKS:
 4. Provide actionable recommendations for improvement
 
 REQUIRED OUTPUT FORMAT (JSON):
-{{
+{
   "is_compliant": boolean,
   "confidence": "high|medium|low",
   "summary": "Brief assessment summary, 1-2 sentences",
   "detailed_analysis": "Detailed explanation of your findings",
   "findings": [
-    {{
+    {
       "description": "Description of finding",
       "severity": "info|warning|error|critical",
       "code_location": "file:line (if applicable)",
       "recommendation": "Specific recommendation to address this finding"
-    }}
+    }
   ],
   "evidence": "Specific code examples or documentation that supports your determination"
-}}
-""",
+}
+"""),
 
-    "data_protection": """
+    "data_protection": Template("""
 You are a specialized validator for data protection requirements.
 
 CONTEXT:
-- Checklist Item: {description}
-- Current Status: {status}
-- Application Description: {app_description}
-- Evidence Context: {evidence_context}
-- Repository: {repository_url} (Commit: {commit_id})
+- Checklist Item: $description
+- Current Status: $status
+- Application Description: $app_description
+- Evidence Context: $evidence_context
+- Repository: $repository_url (Commit: $commit_id)
 
 SPECIFIC INSTRUCTIONS:
 Evaluate the data protection mechanisms implemented in the code. Look specifically for:
@@ -157,7 +162,7 @@ Evaluate the data protection mechanisms implemented in the code. Look specifical
 5. Data leakage prevention
 
 CODE SNIPPETS TO ANALYZE:
-{code_snippets}
+$code_snippets
 
 VALIDATION TASKS:
 1. Determine whether sensitive data is properly protected
@@ -166,35 +171,35 @@ VALIDATION TASKS:
 4. Provide actionable recommendations for improvement
 
 REQUIRED OUTPUT FORMAT (JSON):
-{{
+{
   "is_compliant": boolean,
   "confidence": "high|medium|low",
   "summary": "Brief assessment summary, 1-2 sentences",
   "detailed_analysis": "Detailed explanation of your findings",
   "findings": [
-    {{
+    {
       "description": "Description of finding",
       "severity": "info|warning|error|critical",
       "code_location": "file:line (if applicable)",
       "recommendation": "Specific recommendation to address this finding"
-    }}
+    }
   ],
   "evidence": "Specific code examples or documentation that supports your determination"
-}}
-"""
+}
+""")
 }
 
 # Operational validation prompts
 OPERATIONAL_VALIDATION_PROMPTS = {
-    "logging": """
+    "logging": Template("""
 You are a specialized validator for application logging requirements.
 
 CONTEXT:
-- Checklist Item: {description}
-- Current Status: {status}
-- Application Description: {app_description}
-- Evidence Context: {evidence_context}
-- Repository: {repository_url} (Commit: {commit_id})
+- Checklist Item: $description
+- Current Status: $status
+- Application Description: $app_description
+- Evidence Context: $evidence_context
+- Repository: $repository_url (Commit: $commit_id)
 
 SPECIFIC INSTRUCTIONS:
 Evaluate the logging mechanisms implemented in the code. Look specifically for:
@@ -205,7 +210,7 @@ Evaluate the logging mechanisms implemented in the code. Look specifically for:
 5. Error and exception logging
 
 CODE SNIPPETS TO ANALYZE:
-{code_snippets}
+$code_snippets
 
 VALIDATION TASKS:
 1. Determine whether the application implements proper logging
@@ -214,32 +219,32 @@ VALIDATION TASKS:
 4. Provide actionable recommendations for improvement
 
 REQUIRED OUTPUT FORMAT (JSON):
-{{
+{
   "is_compliant": boolean,
   "confidence": "high|medium|low",
   "summary": "Brief assessment summary, 1-2 sentences",
   "detailed_analysis": "Detailed explanation of your findings",
   "findings": [
-    {{
+    {
       "description": "Description of finding",
       "severity": "info|warning|error|critical",
       "code_location": "file:line (if applicable)",
       "recommendation": "Specific recommendation to address this finding"
-    }}
+    }
   ],
   "evidence": "Specific code examples or documentation that supports your determination"
-}}
-""",
+}
+"""),
 
-    "monitoring": """
+    "monitoring": Template("""
 You are a specialized validator for application monitoring requirements.
 
 CONTEXT:
-- Checklist Item: {description}
-- Current Status: {status}
-- Application Description: {app_description}
-- Evidence Context: {evidence_context}
-- Repository: {repository_url} (Commit: {commit_id})
+- Checklist Item: $description
+- Current Status: $status
+- Application Description: $app_description
+- Evidence Context: $evidence_context
+- Repository: $repository_url (Commit: $commit_id)
 
 SPECIFIC INSTRUCTIONS:
 Evaluate the monitoring capabilities implemented in the code. Look specifically for:
@@ -250,7 +255,7 @@ Evaluate the monitoring capabilities implemented in the code. Look specifically
 5. Alerting configurations
 
 CODE SNIPPETS TO ANALYZE:
-{code_snippets}
+$code_snippets
 
 VALIDATION TASKS:
 1. Determine whether the application implements sufficient monitoring
@@ -259,35 +264,35 @@ VALIDATION TASKS:
 4. Provide actionable recommendations for improvement
 
 REQUIRED OUTPUT FORMAT (JSON):
-{{
+{
   "is_compliant": boolean,
   "confidence": "high|medium|low",
   "summary": "Brief assessment summary, 1-2 sentences",
   "detailed_analysis": "Detailed explanation of your findings",
   "findings": [
-    {{
+    {
       "description": "Description of finding",
       "severity": "info|warning|error|critical",
       "code_location": "file:line (if applicable)",
       "recommendation": "Specific recommendation to address this finding"
-    }}
+    }
   ],
   "evidence": "Specific code examples or documentation that supports your determination"
-}}
-"""
+}
+""")
 }
 
 # Reliability validation prompts
 RELIABILITY_VALIDATION_PROMPTS = {
-    "error_handling": """
+    "error_handling": Template("""
 You are a specialized validator for application error handling requirements.
 
 CONTEXT:
-- Checklist Item: {description}
-- Current Status: {status}
-- Application Description: {app_description}
-- Evidence Context: {evidence_context}
-- Repository: {repository_url} (Commit: {commit_id})
+- Checklist Item: $description
+- Current Status: $status
+- Application Description: $app_description
+- Evidence Context: $evidence_context
+- Repository: $repository_url (Commit: $commit_id)
 
 SPECIFIC INSTRUCTIONS:
 Evaluate the error handling mechanisms implemented in the code. Look specifically for:
@@ -298,7 +303,7 @@ Evaluate the error handling mechanisms implemented in the code. Look specificall
 5. Error logging and monitoring
 
 CODE SNIPPETS TO ANALYZE:
-{code_snippets}
+$code_snippets
 
 VALIDATION TASKS:
 1. Determine whether the application handles errors appropriately
@@ -307,32 +312,32 @@ VALIDATION TASKS:
 4. Provide actionable recommendations for improvement
 
 REQUIRED OUTPUT FORMAT (JSON):
-{{
+{
   "is_compliant": boolean,
   "confidence": "high|medium|low",
   "summary": "Brief assessment summary, 1-2 sentences",
   "detailed_analysis": "Detailed explanation of your findings",
   "findings": [
-    {{
+    {
       "description": "Description of finding",
       "severity": "info|warning|error|critical",
       "code_location": "file:line (if applicable)",
       "recommendation": "Specific recommendation to address this finding"
-    }}
+    }
   ],
   "evidence": "Specific code examples or documentation that supports your determination"
-}}
-""",
+}
+"""),
 
-    "resilience": """
+    "resilience": Template("""
 You are a specialized validator for application resilience requirements.
 
 CONTEXT:
-- Checklist Item: {description}
-- Current Status: {status}
-- Application Description: {app_description}
-- Evidence Context: {evidence_context}
-- Repository: {repository_url} (Commit: {commit_id})
+- Checklist Item: $description
+- Current Status: $status
+- Application Description: $app_description
+- Evidence Context: $evidence_context
+- Repository: $repository_url (Commit: $commit_id)
 
 SPECIFIC INSTRUCTIONS:
 Evaluate the resilience mechanisms implemented in the code. Look specifically for:
@@ -343,7 +348,7 @@ Evaluate the resilience mechanisms implemented in the code. Look specifically fo
 5. Timeout handling
 
 CODE SNIPPETS TO ANALYZE:
-{code_snippets}
+$code_snippets
 
 VALIDATION TASKS:
 1. Determine whether the application implements resilience patterns
@@ -352,22 +357,22 @@ VALIDATION TASKS:
 4. Provide actionable recommendations for improvement
 
 REQUIRED OUTPUT FORMAT (JSON):
-{{
+{
   "is_compliant": boolean,
   "confidence": "high|medium|low",
   "summary": "Brief assessment summary, 1-2 sentences",
   "detailed_analysis": "Detailed explanation of your findings",
   "findings": [
-    {{
+    {
       "description": "Description of finding",
       "severity": "info|warning|error|critical",
       "code_location": "file:line (if applicable)",
       "recommendation": "Specific recommendation to address this finding"
-    }}
+    }
   ],
   "evidence": "Specific code examples or documentation that supports your determination"
-}}
-"""
+}
+""")
 }
 
 # Map categories to appropriate prompts
@@ -398,7 +403,7 @@ def get_validation_prompt(category_name=None, checklist_item_description=None):
         checklist_item_description (str, optional): The description to analyze for keywords
         
     Returns:
-        str: The validation prompt template
+        Template: The validation prompt template
     """
     if category_name and category_name.lower() in CATEGORY_PROMPT_MAPPING:
         return CATEGORY_PROMPT_MAPPING[category_name.lower()]
@@ -193,7 +193,7 @@ class ValidationService:
         code_snippets_text = "\n\n".join([f"```\n{snippet}\n```" for snippet in code_snippets]) if code_snippets else "No code snippets provided."
         
         # Format prompt with context
-        formatted_prompt = prompt_template.format(
+        formatted_prompt = prompt_template.substitute(
             description=checklist_item.description,
             status=checklist_item.status,
             app_description=application_description,
@@ -2,16 +2,50 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
+import json
 from dotenv import load_dotenv
 
+# orjson is optional, JSON columns fall back to the standard library without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./cloudtracker.db")
 # Add alias for backward compatibility
 SQLALCHEMY_DATABASE_URL = DATABASE_URL
 
+def _json_serializer(value):
+    """Serialize JSON column values, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, separators=(",", ":"))
+
+def _json_deserializer(value):
+    """Deserialize JSON column values, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+# One process-wide engine and pool shared by the API and the workflow steps.
+# check_same_thread only exists for SQLite, other databases get a sized pool
+# that is checked before handing out connections.
+if DATABASE_URL.startswith("sqlite"):
+    engine_options = {"connect_args": {"check_same_thread": False}}
+else:
+    engine_options = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "15")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "15")),
+        "pool_pre_ping": True
+    }
+
 engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False}
+    DATABASE_URL,
+    json_serializer=_json_serializer,
+    json_deserializer=_json_deserializer,
+    **engine_options
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
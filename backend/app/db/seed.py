@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import insert, text
 import random
 
 from ..models.models import User, Application, Category, ChecklistItem, Activity, UserRole
@@ -36,21 +36,24 @@ def create_application_checklist_items(db: Session, category_id: str):
     }
     
     items = base_items.get(category_id, [])
+    # Build the rows first and insert them with one executemany INSERT
+    rows = []
     for index, description in enumerate(items):
         status_options = ['Not Started', 'In Progress', 'Completed', 'Verified']
         days_ago = random.randint(0, 30)
         last_updated = datetime.utcnow() - timedelta(days=days_ago)
         
-        item = ChecklistItem(
-            id=f"{category_id}-item-{index}",
-            description=description,
-            status='Not Started',  # Default is 'Not Started' for seed data
-            last_updated=last_updated,
-            comments=f"Comment for {description}" if random.random() > 0.7 else "",
-            evidence=f"https://example.com/evidence/{category_id}/{index}" if random.random() > 0.6 else "",
-            category_id=category_id
-        )
-        db.add(item)
+        rows.append({
+            "id": f"{category_id}-item-{index}",
+            "description": description,
+            "status": 'Not Started',  # Default is 'Not Started' for seed data
+            "last_updated": last_updated,
+            "comments": f"Comment for {description}" if random.random() > 0.7 else "",
+            "evidence": f"https://example.com/evidence/{category_id}/{index}" if random.random() > 0.6 else "",
+            "category_id": category_id
+        })
+    if rows:
+        db.execute(insert(ChecklistItem), rows)
 
 def create_platform_checklist_items(db: Session, category_id: str):
     base_items = {
@@ -77,21 +80,24 @@ def create_platform_checklist_items(db: Session, category_id: str):
     }
     
     items = base_items.get(category_id, [])
+    # Build the rows first and insert them with one executemany INSERT
+    rows = []
     for index, description in enumerate(items):
         status_options = ['Not Started', 'In Progress', 'Completed', 'Verified']
         days_ago = random.randint(0, 30)
         last_updated = datetime.utcnow() - timedelta(days=days_ago)
         
-        item = ChecklistItem(
-            id=f"{category_id}-item-{index}",
-            description=description,
-            status='Not Started',  # Default is 'Not Started' for seed data
-            last_updated=last_updated,
-            comments=f"Comment for {description}" if random.random() > 0.7 else "",
-            evidence=f"https://example.com/evidence/{category_id}/{index}" if random.random() > 0.6 else "",
-            category_id=category_id
-        )
-        db.add(item)
+        rows.append({
+            "id": f"{category_id}-item-{index}",
+            "description": description,
+            "status": 'Not Started',  # Default is 'Not Started' for seed data
+            "last_updated": last_updated,
+            "comments": f"Comment for {description}" if random.random() > 0.7 else "",
+            "evidence": f"https://example.com/evidence/{category_id}/{index}" if random.random() > 0.6 else "",
+            "category_id": category_id
+        })
+    if rows:
+        db.execute(insert(ChecklistItem), rows)
 
 def create_application_categories(db: Session):
     categories = [
@@ -117,15 +123,11 @@ def create_application_categories(db: Session):
         }
     ]
     
+    # Insert the categories in one statement ahead of their checklist items,
+    # no flush per category is needed
+    db.execute(insert(Category), categories)
     for category_data in categories:
-        category = Category(
-            id=category_data['id'],
-            name=category_data['name'],
-            category_type=category_data['category_type']
-        )
-        db.add(category)
-        db.flush()
-        create_application_checklist_items(db, category.id)
+        create_application_checklist_items(db, category_data['id'])
     
     return categories
 
@@ -158,15 +160,11 @@ def create_platform_categories(db: Session):
         }
     ]
     
+    # Insert the categories in one statement ahead of their checklist items,
+    # no flush per category is needed
+    db.execute(insert(Category), categories)
     for category_data in categories:
-        category = Category(
-            id=category_data['id'],
-            name=category_data['name'],
-            category_type=category_data['category_type']
-        )
-        db.add(category)
-        db.flush()
-        create_platform_checklist_items(db, category.id)
+        create_platform_checklist_items(db, category_data['id'])
     
     return categories
 
@@ -226,6 +224,10 @@ def seed_db(db: Session):
     tech_stacks = ['Java', '.NET', 'Python', 'Angular', 'React']
     build_packs = ['Gradle', 'Maven', 'NPM', 'Pip']
     
+    # Category associations and activities are collected as rows and
+    # inserted together after the loop
+    association_rows = []
+    activity_rows = []
     for i in range(1, 21):
         days_ago = random.randint(30, 90)
         created_at = datetime.utcnow() - timedelta(days=days_ago)
@@ -293,22 +295,13 @@ def seed_db(db: Session):
             uses_epl=uses_epl
         )
         db.add(app)
-        db.flush()
         
         # Assign random categories with proper category_type
         for app_category in random.sample(app_categories, k=2):
-            # We need to manually execute SQL to set the category_type in the join table
-            db.execute(
-                text("INSERT INTO application_category_association (application_id, category_id, category_type) VALUES (:app_id, :cat_id, 'application')"),
-                {"app_id": app.id, "cat_id": app_category['id']}
-            )
+            association_rows.append({"app_id": app.id, "cat_id": app_category['id'], "category_type": "application"})
             
         for platform_category in random.sample(platform_categories, k=2):
-            # We need to manually execute SQL to set the category_type in the join table
-            db.execute(
-                text("INSERT INTO application_category_association (application_id, category_id, category_type) VALUES (:app_id, :cat_id, 'platform')"),
-                {"app_id": app.id, "cat_id": platform_category['id']}
-            )
+            association_rows.append({"app_id": app.id, "cat_id": platform_category['id'], "category_type": "platform"})
         
         # Create activities for this application
         action_types = ['updated', 'created', 'status changed', 'reviewed']
@@ -316,15 +309,23 @@ def seed_db(db: Session):
             days_ago = random.randint(0, 30)
             timestamp = datetime.utcnow() - timedelta(days=days_ago)
             
-            activity = Activity(
-                id=str(uuid.uuid4()),
-                action=random.choice(action_types),
-                timestamp=timestamp,
-                user_id=admin_user.id,
-                application_id=app.id
-            )
-            db.add(activity)
+            activity_rows.append({
+                "id": str(uuid.uuid4()),
+                "action": random.choice(action_types),
+                "timestamp": timestamp,
+                "user_id": admin_user.id,
+                "application_id": app.id
+            })
+    
+    # Flush the applications once so the rows below can reference them
+    db.flush()
     
+    # We need to manually execute SQL to set the category_type in the join table
+    db.execute(
+        text("INSERT INTO application_category_association (application_id, category_id, category_type) VALUES (:app_id, :cat_id, :category_type)"),
+        association_rows
+    )
+    db.execute(insert(Activity), activity_rows)
     db.commit()
     
     print("Database seeded successfully!") 
\ No newline at end of file
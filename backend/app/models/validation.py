@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime, Text, Table, Enum, JSON
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime, Text, Table, Enum, JSON, Index
 from sqlalchemy.orm import relationship
 import datetime
 from ..db.database import Base
@@ -83,6 +83,11 @@ class ValidationStep(Base):
     # Relationships
     workflow = relationship("ValidationWorkflow", back_populates="steps")
     findings = relationship("ValidationStepFinding", back_populates="step", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Steps are looked up by workflow and type when running a workflow
+        Index('ix_validation_steps_workflow_step_type', 'workflow_id', 'step_type'),
+    )
 
 class ValidationStepFinding(Base):
     __tablename__ = "validation_step_findings"
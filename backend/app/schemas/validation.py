@@ -145,7 +145,7 @@ class AppValidationRequest(BaseModel):
     repository_url: str
     commit_id: Optional[str] = None
     steps: List[ValidationStepType] = Field(
-        default_factory=lambda: [step for step in ValidationStepType]
+        default_factory=lambda: list(ValidationStepType)
     )
     integrations: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
     additional_context: Optional[Dict[str, Any]] = None
@@ -0,0 +1,153 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core import workflow_service
+from app.core.workflow_service import WorkflowService
+from app.db.database import Base
+from app.models.models import Application, Category, ChecklistItem, application_category_association
+from app.models.validation import (
+    ValidationSeverity,
+    ValidationStatus,
+    ValidationStep,
+    ValidationStepFinding,
+    ValidationStepStatus,
+    ValidationStepType,
+    ValidationWorkflow,
+)
+
+# (category id, category type, associated with the app, items as (description, status))
+CATEGORIES = [
+    ("availability", "application", True, [
+        ("Retry Logic", "Not Started"),
+        ("Set timeouts on IO operation", "Not Started"),
+        ("Auto scale", "In Progress"),
+        ("Throttling, drop request", "Verified"),
+    ]),
+    ("auditability", "application", True, [
+        ("Create audit trail logs", "Verified"),
+        ("Log REST API calls", "Not Started"),
+    ]),
+    ("platform-monitoring-app", "platform", True, [
+        ("URL monitoring", "Not Started"),
+        ("Monitor port availability", "Verified"),
+        ("Monitor application heap memory usage", "Completed"),
+    ]),
+    ("testing", "application", False, [
+        ("Automated Regression Testing", "Not Started"),
+    ]),
+]
+
+# (step type, step status, finding descriptions)
+STEPS = [
+    (ValidationStepType.APP_REQUIREMENTS, ValidationStepStatus.COMPLETED, [
+        "Failed to validate requirement: Retry Logic",
+        # An item already verified still gets flagged when a finding names it
+        "Failed to validate requirement: Create audit trail logs",
+    ]),
+    (ValidationStepType.PLATFORM_REQUIREMENTS, ValidationStepStatus.COMPLETED, [
+        "Failed to validate platform requirement: URL monitoring",
+    ]),
+    # Findings of steps that did not complete are ignored
+    (ValidationStepType.SECURITY, ValidationStepStatus.FAILED, [
+        "Failed to validate requirement: Auto scale",
+    ]),
+]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _seed(db):
+    db.add(Application(id="app-1", name="Application 1"))
+    for category_id, category_type, associated, items in CATEGORIES:
+        db.add(Category(id=category_id, name=category_id, category_type=category_type))
+        for index, (description, status) in enumerate(items):
+            db.add(ChecklistItem(
+                id=f"{category_id}-item-{index}",
+                description=description,
+                status=status,
+                category_id=category_id
+            ))
+    db.flush()
+    db.execute(insert(application_category_association), [
+        {"application_id": "app-1", "category_id": category_id, "category_type": category_type}
+        for category_id, category_type, associated, _ in CATEGORIES
+        if associated
+    ])
+    
+    workflow = ValidationWorkflow(
+        id="wf-1",
+        application_id="app-1",
+        status=ValidationStatus.COMPLETED,
+        completed_at=datetime(2024, 1, 1),
+        repository_url="https://github.com/example/app-1",
+        commit_id="abc123"
+    )
+    db.add(workflow)
+    for step_index, (step_type, step_status, descriptions) in enumerate(STEPS):
+        step = ValidationStep(id=f"step-{step_index}", workflow_id="wf-1", step_type=step_type, status=step_status)
+        db.add(step)
+        for finding_index, description in enumerate(descriptions):
+            db.add(ValidationStepFinding(
+                id=f"finding-{step_index}-{finding_index}",
+                step_id=step.id,
+                description=description,
+                severity=ValidationSeverity.WARNING
+            ))
+    db.commit()
+    return workflow
+
+
+def _expected_statuses():
+    """Statuses from the per-row version: check each item against each finding."""
+    findings = [
+        description
+        for _, step_status, descriptions in STEPS
+        if step_status == ValidationStepStatus.COMPLETED
+        for description in descriptions
+    ]
+    expected = {}
+    for category_id, _, associated, items in CATEGORIES:
+        for index, (description, status) in enumerate(items):
+            if associated and any(description in finding for finding in findings):
+                status = "In Progress"
+            elif associated and status != "Verified":
+                status = "Completed"
+            expected[f"{category_id}-item-{index}"] = status
+    return expected
+
+
+@pytest.mark.parametrize("use_ahocorasick", [False, True], ids=["substring", "ahocorasick"])
+def test_checklist_statuses_match_per_row_update(db, monkeypatch, use_ahocorasick):
+    if use_ahocorasick:
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(workflow_service, "ahocorasick", None)
+    workflow = _seed(db)
+    
+    WorkflowService._update_checklist_items(db, "app-1", workflow)
+    db.commit()
+    
+    items = {item.id: item for item in db.query(ChecklistItem).all()}
+    assert {item_id: item.status for item_id, item in items.items()} == _expected_statuses()
+    
+    # The sample covers every outcome
+    assert {item.status for item in items.values()} >= {"In Progress", "Completed", "Verified"}
+    
+    completed = items["availability-item-1"]
+    assert completed.evidence == "https://github.com/example/app-1/tree/abc123"
+    assert "wf-1" in completed.comments
+    assert items["availability-item-0"].comments == "Validation found issues that need to be addressed"
+    # Items of categories not associated with the application are left alone
+    assert items["testing-item-0"].status == "Not Started"
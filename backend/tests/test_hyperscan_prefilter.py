@@ -0,0 +1,86 @@
+import pytest
+
+from app.core import workflow_service
+from app.core.workflow_service import _count_pattern_matches, _default_analysis_config
+
+hyperscan = pytest.importorskip("hyperscan")
+
+SAMPLE_FILES = [
+    "import log4j.Logger;\nimport  slf4j.LoggerFactory;\nlogger.info('started')\nlogger.error('failed')\n",
+    "const winston = require('winston');\nimport winston from 'winston'\nimport\tbunyan\nconsole.error(err)\n",
+    "logging.getLogger(__name__)\nLOGGING.info('x')\nLogger.Error('Upper case')\n",
+    "password = get(); log(password)\nsecret_logger\nTOKEN sent to LOG\ncredentials in the log\n",
+    "encrypt(data)\nDecrypt(data)\nhash = sha256()\nHASHED\n",
+    "retry(3)\nretryWhen(errors)\nmaxRetries: 5\nexponential backoff\n",
+    "timeout=30\ntimeoutMs: 100\nconnectionTimeout = 5\nTIMEOUT\n",
+    "autoscale: true\nkind: HorizontalPodAutoscaler\nthrottle()\nrateLimit(10)\nrateLimiter\n",
+    "circuitBreaker()\n@HystrixCommand\nresilience4j.circuitbreaker\n",
+    "try {\n  run()\n} catch {\n} finally {\n}\ntry{\n}\nthrow new Error('x')\nthrow  new  Exception(e)\n",
+    "nothing to see here\njust plain text\n",
+    "",
+]
+
+
+def _default_patterns():
+    regex_patterns, _ = _default_analysis_config()
+    return tuple(pattern for patterns in regex_patterns.values() for pattern in patterns)
+
+
+def test_counts_match_without_hyperscan(monkeypatch):
+    patterns = _default_patterns()
+    with_hyperscan = _count_pattern_matches(SAMPLE_FILES, patterns)
+    
+    monkeypatch.setattr(workflow_service, "hyperscan", None)
+    without_hyperscan = _count_pattern_matches(SAMPLE_FILES, patterns)
+    
+    assert with_hyperscan == without_hyperscan
+    assert sum(with_hyperscan) > 0
+
+
+def test_prefilter_patterns_are_confirmed_by_regex(monkeypatch):
+    # In prefilter mode hyperscan only approximates the backreference, so
+    # the regex has to do the actual counting
+    patterns = (r"(ab)\1", r"retry")
+    contents = ["abab retry", "ab retry retry"]
+    with_hyperscan = _count_pattern_matches(contents, patterns)
+    
+    monkeypatch.setattr(workflow_service, "hyperscan", None)
+    assert with_hyperscan == _count_pattern_matches(contents, patterns) == [1, 3]
+
+
+@pytest.mark.parametrize("patterns, contents", [
+    # Rejected by hyperscan even in prefilter mode
+    ((r"a{0,70000}b", r"retry"), ["aab retry", "b"]),
+    # A POSIX class for hyperscan, literal set members for Python
+    ((r"[[:alpha:]]x", r"retry"), ["a]x", "zzz :x retry"]),
+    # A literal for hyperscan, a repeat for Python
+    ((r"a{,2}b", r"retry"), ["aab", "b"]),
+])
+def test_patterns_hyperscan_cant_screen_are_counted(monkeypatch, patterns, contents):
+    with_hyperscan = _count_pattern_matches(contents, patterns)
+    
+    monkeypatch.setattr(workflow_service, "hyperscan", None)
+    without_hyperscan = _count_pattern_matches(contents, patterns)
+    
+    assert with_hyperscan == without_hyperscan
+    assert with_hyperscan[0] > 0
+
+
+def test_per_thread_databases_are_bounded(monkeypatch):
+    monkeypatch.setattr(workflow_service, "_HYPERSCAN_DATABASES_PER_THREAD", 2)
+    monkeypatch.setattr(workflow_service, "_hyperscan_local", workflow_service.threading.local())
+    for pattern in (r"retry\d", r"timeout\d", r"throttle\d"):
+        assert workflow_service._get_hyperscan_matcher(((0, pattern), (1, r"log\w+"))) is not None
+    assert list(workflow_service._hyperscan_local.databases) == [
+        ((0, r"timeout\d"), (1, r"log\w+")),
+        ((0, r"throttle\d"), (1, r"log\w+")),
+    ]
+
+
+def test_pattern_support_is_checked_once(monkeypatch):
+    workflow_service._hyperscan_supports.cache_clear()
+    monkeypatch.setattr(workflow_service, "_hyperscan_local", workflow_service.threading.local())
+    # Subsets of the same patterns only compile their combined database
+    workflow_service._get_hyperscan_matcher(((0, r"retry\d"), (1, r"log\w+")))
+    workflow_service._get_hyperscan_matcher(((1, r"log\w+"),))
+    assert workflow_service._hyperscan_supports.cache_info().misses == 2
@@ -0,0 +1,91 @@
+import re
+
+import pytest
+
+from app.core import workflow_service
+from app.core.workflow_service import (
+    WorkflowService,
+    _REGEX_SCAN_FLAGS,
+    _compile_scan_patterns,
+    _count_pattern_matches,
+    _default_analysis_config,
+)
+
+SAMPLE_FILES = [
+    "import log4j.Logger;\nlogger.info('started')\nLOGGER.error('failed')\nlogging.basicConfig()\n",
+    "const winston = require('winston')\nimport winston from 'winston'\nconsole.error(err)\n",
+    "password = read(); log(password)\nTOKEN sent to the LOG\nencrypt(x) decrypt(x) hash(x)\n",
+    "retry(3) retryWhen(e) maxRetries=5 backoff\nRETRY RetryWhen\ntimeout=1 timeoutMs connectionTimeout\n",
+    "kind: HorizontalPodAutoscaler\nautoscale: on\nthrottle rateLimit rateLimiter\ncircuitBreaker hystrix resilience4j\n",
+    "try {\n} catch {\n} finally {\n}\nthrow new Error('x')\nthrow  new\tException(e)\n",
+    # Non-ASCII content goes through the str regexes only
+    "Ünïcödé logger.info('größe') retry tïmeout timeout\nLOGGER.ERROR\n",
+    "nothing to see here\n",
+    "",
+]
+
+
+def _default_patterns():
+    regex_patterns, _ = _default_analysis_config()
+    return tuple(pattern for patterns in regex_patterns.values() for pattern in patterns)
+
+
+@pytest.fixture
+def no_hyperscan(monkeypatch):
+    monkeypatch.setattr(workflow_service, "hyperscan", None)
+
+
+def test_literal_counts_match_regex_counts(no_hyperscan):
+    patterns = _default_patterns()
+    literals, _, _ = _compile_scan_patterns(patterns)
+    # Most default patterns are plain literals, so the str.count path is exercised
+    assert len(literals) > len(patterns) // 2
+    
+    expected = [
+        sum(len(re.findall(pattern, content, _REGEX_SCAN_FLAGS)) for content in SAMPLE_FILES)
+        for pattern in patterns
+    ]
+    assert _count_pattern_matches(SAMPLE_FILES, patterns) == expected
+
+
+def test_bytes_patterns_match_str_patterns_on_ascii():
+    patterns = _default_patterns()
+    _, findalls, ascii_findalls = _compile_scan_patterns(patterns)
+    str_findalls = dict(findalls)
+    ascii_contents = [content for content in SAMPLE_FILES if content.isascii()]
+    for index, bytes_findall in ascii_findalls:
+        for content in ascii_contents:
+            assert len(bytes_findall(content.encode("ascii"))) == len(str_findalls[index](content)), patterns[index]
+
+
+def _scan(monkeypatch, stop_at_min_matches, files):
+    monkeypatch.setattr(workflow_service, "REGEX_SCAN_STOP_AT_MIN_MATCHES", stop_at_min_matches)
+    # Scan in-process in small chunks so the thresholds are checked between chunks
+    monkeypatch.setattr(workflow_service, "REGEX_SCAN_WORKERS", 1)
+    monkeypatch.setattr(workflow_service, "REGEX_SCAN_POOL_MIN_FILES", 2)
+    return WorkflowService._analyze_repository_with_regex(files, analysis_id="test")
+
+
+def test_stop_at_min_matches_keeps_flags_and_lower_bounds(monkeypatch, no_hyperscan):
+    files = [(f"src/file{i}.py", content) for i, content in enumerate(SAMPLE_FILES * 4)]
+    _, min_matches = _default_analysis_config()
+    
+    full = _scan(monkeypatch, False, files)
+    stopped = _scan(monkeypatch, True, files)
+    
+    # Every result flag is the same, only the counts become lower bounds
+    assert {key: value for key, value in stopped.items() if key != "patterns_found"} == \
+        {key: value for key, value in full.items() if key != "patterns_found"}
+    for category, count in full["patterns_found"].items():
+        assert min(count, min_matches[category]) <= stopped["patterns_found"][category] <= count
+    # The scan did stop early for at least one category
+    assert stopped["patterns_found"] != full["patterns_found"]
+
+
+def test_stop_at_min_matches_scans_until_threshold(monkeypatch, no_hyperscan):
+    # Each file has one availability match, the minimum is 4, so the category
+    # must keep being scanned until four files were counted
+    files = [(f"src/file{i}.py", "retry\n") for i in range(10)]
+    stopped = _scan(monkeypatch, True, files)
+    assert stopped["patterns_found"]["availability"] >= 4
+    assert stopped["has_retry_logic"] is True
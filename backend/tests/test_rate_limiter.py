@@ -0,0 +1,23 @@
+import time
+
+import pytest
+
+from app.core.utils.call_llm import TokenBucket
+
+
+@pytest.mark.parametrize("rpm, tpm", [(0, 0), (-1, 0), (0, 150000), (60, 0)])
+def test_disabled_limits_dont_block(rpm, tpm):
+    bucket = TokenBucket(rpm, tpm)
+    start = time.monotonic()
+    for _ in range(5 if rpm > 0 else 100):
+        bucket.acquire(tokens=100000 if tpm <= 0 else 1000)
+    assert time.monotonic() - start < 1
+
+
+def test_token_limit_applies_without_a_request_limit():
+    bucket = TokenBucket(0, 6000)
+    bucket.acquire(tokens=6000)
+    start = time.monotonic()
+    bucket.acquire(tokens=100)
+    # 100 tokens refill in a second at 6000 per minute
+    assert time.monotonic() - start >= 0.9
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from app.core import workflow_service
+from app.core.workflow_service import WorkflowService
+
+REPOSITORY_URL = "https://github.com/example/app-1"
+HEAD_COMMIT = "a" * 40
+MOVED_COMMIT = "b" * 40
+
+
+@pytest.fixture
+def analysis_cache(monkeypatch):
+    cache = workflow_service.OrderedDict()
+    monkeypatch.setattr(workflow_service, "_repo_analysis_cache", cache)
+    monkeypatch.setattr(WorkflowService, "_resolve_remote_head", staticmethod(lambda url, config=None: HEAD_COMMIT))
+    return cache
+
+
+def _analyze_at(monkeypatch, analyzed_commit, commit_fallback=False):
+    calls = []
+    
+    async def analyze(repository_url, config=None, commit_id=None):
+        calls.append(commit_id)
+        results = {"has_logging_framework": True, "analyzed_commit": analyzed_commit}
+        if commit_fallback:
+            results["commit_fallback"] = True
+        return results
+    
+    monkeypatch.setattr(WorkflowService, "_analyze_repository", staticmethod(analyze))
+    return calls
+
+
+def test_pinned_commit_is_cached(analysis_cache, monkeypatch):
+    calls = _analyze_at(monkeypatch, HEAD_COMMIT)
+    for _ in range(2):
+        asyncio.run(WorkflowService._analyze_repository_cached(REPOSITORY_URL, commit_id=HEAD_COMMIT))
+    assert calls == [HEAD_COMMIT]
+    assert [key[1] for key in analysis_cache] == [HEAD_COMMIT]
+
+
+def test_branch_head_fallback_is_not_cached(analysis_cache, monkeypatch):
+    pinned = "0123456789abcdef0123456789abcdef01234567"
+    calls = _analyze_at(monkeypatch, HEAD_COMMIT, commit_fallback=True)
+    for _ in range(2):
+        results = asyncio.run(WorkflowService._analyze_repository_cached(REPOSITORY_URL, commit_id=pinned))
+        assert results["commit_fallback"]
+    assert calls == [pinned, pinned]
+    assert not analysis_cache
+
+
+def test_unpinned_analysis_is_keyed_on_the_analyzed_commit(analysis_cache, monkeypatch):
+    # The branch moved between ls-remote and the clone
+    _analyze_at(monkeypatch, MOVED_COMMIT)
+    asyncio.run(WorkflowService._analyze_repository_cached(REPOSITORY_URL))
+    assert [key[1] for key in analysis_cache] == [MOVED_COMMIT]
+
+
+def test_unresolved_analyzed_commit_is_not_cached(analysis_cache, monkeypatch):
+    _analyze_at(monkeypatch, None)
+    asyncio.run(WorkflowService._analyze_repository_cached(REPOSITORY_URL))
+    assert not analysis_cache
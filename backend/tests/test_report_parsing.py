@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from app.core import workflow_service
+from app.core.workflow_service import WorkflowService
+
+pytest.importorskip("ahocorasick")
+
+TERMS = [
+    "log4j", "slf4j", "Winston", "splunk", "Password", "not log", "audit", "log", "traceId", "API",
+    "REST", "UI", "error", "system", "retry", "Timeout", "auto", "scaling", "throttle", "rate limit",
+    "circuit breaker", "HTTP", "client", "track", "test", "java.util.logging", "nlog",
+]
+HEADINGS = ["## Logging Analysis", "# Availability Analysis", "## Error Handling Analysis"]
+
+
+def _sample_reports(count=200):
+    rng = random.Random(3)
+    return [
+        "\n".join(rng.sample(HEADINGS, rng.randint(0, 3))) + " "
+        + " ".join(rng.choice(TERMS) for _ in range(rng.randint(0, 12)))
+        for _ in range(count)
+    ]
+
+
+def _parse_all(reports):
+    return [WorkflowService._parse_llm_analysis_report(report, ["a/test_x.py"], "test") for report in reports]
+
+
+def test_report_flags_match_without_ahocorasick(monkeypatch):
+    reports = _sample_reports()
+    with_automaton = _parse_all(reports)
+    
+    monkeypatch.setattr(workflow_service, "ahocorasick", None)
+    assert with_automaton == _parse_all(reports)
@@ -0,0 +1,62 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import workflow_service
+from app.core.workflow_service import WorkflowService
+
+REPOSITORY_URL = "https://github.com/example/app-1"
+COMMIT_ID = "a" * 40
+
+
+class _FakeSession:
+    def execute(self, *args, **kwargs):
+        pass
+
+
+@pytest.fixture
+def step_cache(monkeypatch):
+    cache = workflow_service.OrderedDict()
+    monkeypatch.setattr(workflow_service, "_step_result_cache", cache)
+    monkeypatch.setattr(workflow_service, "CODE_QUALITY_TOOL_CMD", "code-quality-tool {repository_url}")
+    
+    async def execute_step(step_id, step_name, run, commit_running=False):
+        return await run(_FakeSession(), SimpleNamespace())
+    
+    monkeypatch.setattr(WorkflowService, "_execute_step", staticmethod(execute_step))
+    return cache
+
+
+def _tool_returning(monkeypatch, report):
+    calls = []
+    
+    async def run_tool(cmd, timeout=600):
+        calls.append(cmd)
+        await asyncio.sleep(0.01)
+        return report
+    
+    monkeypatch.setattr(workflow_service, "_run_analysis_tool", run_tool)
+    return calls
+
+
+async def _run_concurrently(count):
+    return await asyncio.gather(*(
+        WorkflowService._run_code_quality_check(f"step-{i}", "app-1", "Application 1", REPOSITORY_URL, COMMIT_ID)
+        for i in range(count)
+    ))
+
+
+def test_concurrent_checks_of_a_commit_run_the_tool_once(step_cache, monkeypatch):
+    calls = _tool_returning(monkeypatch, {"issues": []})
+    results = asyncio.run(_run_concurrently(3))
+    assert len(calls) == 1
+    assert all(result["details"]["tool_report"] == {"issues": []} for result in results)
+    assert len(step_cache) == 1
+
+
+def test_failed_tool_run_is_not_cached(step_cache, monkeypatch):
+    calls = _tool_returning(monkeypatch, None)
+    asyncio.run(_run_concurrently(2))
+    assert len(calls) == 2
+    assert not step_cache
@@ -0,0 +1,78 @@
+import pytest
+
+from app.core.workflow_service import WorkflowService
+
+# The outcome of the per-rule _validate_* implementations the table replaced,
+# as (flags the rule reads, validated for given analysis results)
+_REFERENCE_RULES = {
+    "Logs are searchable and available": (
+        ("has_logging_framework", "has_log_search_integration"),
+        lambda a: bool(a.get("has_logging_framework") and a.get("has_log_search_integration")),
+    ),
+    "Avoid logging confidential data": (
+        ("has_confidential_data_logging",),
+        lambda a: not a.get("has_confidential_data_logging", True),
+    ),
+    "Create audit trail logs": (("has_audit_logs",), lambda a: bool(a.get("has_audit_logs"))),
+    "Implement tracking ID for log messages": (("has_trace_id",), lambda a: bool(a.get("has_trace_id"))),
+    "Log REST API calls": (("has_api_call_logging",), lambda a: bool(a.get("has_api_call_logging"))),
+    "Client UI errors are logged": (("has_ui_error_logging",), lambda a: bool(a.get("has_ui_error_logging"))),
+    "Retry Logic": (("has_retry_logic",), lambda a: bool(a.get("has_retry_logic"))),
+    "Set timeouts on IO operation": (("has_io_timeouts",), lambda a: bool(a.get("has_io_timeouts"))),
+    "Auto scale": (("has_auto_scaling_config",), lambda a: bool(a.get("has_auto_scaling_config"))),
+    "Throttling, drop request": (("has_throttling",), lambda a: bool(a.get("has_throttling"))),
+    "Set circuit breakers on outgoing requests": (("has_circuit_breaker",), lambda a: bool(a.get("has_circuit_breaker"))),
+    "Log system errors": (("has_system_error_logging",), lambda a: bool(a.get("has_system_error_logging"))),
+    "Use HTTP standard error codes": (("has_standard_http_codes",), lambda a: bool(a.get("has_standard_http_codes"))),
+    "Include Client error tracking": (("has_client_error_tracking",), lambda a: bool(a.get("has_client_error_tracking"))),
+}
+
+
+def _check_outcome(result, validated):
+    assert result["validated"] is validated
+    if validated:
+        assert result["details"]
+    else:
+        assert result["reason"]
+        assert result["recommendation"]
+
+
+def test_every_rule_is_covered():
+    assert set(WorkflowService._VALIDATION_RULES) == set(_REFERENCE_RULES) | {
+        "Log application messages",
+        "Automated Regression Testing",
+    }
+
+
+@pytest.mark.parametrize("description", sorted(_REFERENCE_RULES))
+@pytest.mark.parametrize("flag_value", [None, True, False], ids=["missing", "true", "false"])
+def test_flag_rule_matches_reference(description, flag_value):
+    flags, reference = _REFERENCE_RULES[description]
+    analysis = {} if flag_value is None else {flag: flag_value for flag in flags}
+    result = WorkflowService._VALIDATION_RULES[description](analysis, None)
+    _check_outcome(result, reference(analysis))
+
+
+def test_flag_rule_needs_every_flag():
+    analysis = {"has_logging_framework": True, "has_log_search_integration": False}
+    result = WorkflowService._VALIDATION_RULES["Logs are searchable and available"](analysis, None)
+    _check_outcome(result, False)
+
+
+@pytest.mark.parametrize("analysis, validated", [
+    ({}, False),
+    ({"patterns_found": {"logging_patterns": 11}}, True),
+    ({"patterns_found": {"logging_patterns": 10}}, False),
+])
+def test_app_logging_rule(analysis, validated):
+    _check_outcome(WorkflowService._VALIDATION_RULES["Log application messages"](analysis, None), validated)
+
+
+@pytest.mark.parametrize("analysis, validated", [
+    ({}, False),
+    ({"has_automated_tests": True, "test_coverage": 71}, True),
+    ({"has_automated_tests": True, "test_coverage": 70}, False),
+    ({"has_automated_tests": False, "test_coverage": 90}, False),
+])
+def test_regression_testing_rule(analysis, validated):
+    _check_outcome(WorkflowService._VALIDATION_RULES["Automated Regression Testing"](analysis, None), validated)